@@ -7,7 +7,13 @@ Neo4j and Milvus imports are lazy to avoid requiring those dependencies
 for repos that only need logging/config utilities.
 """
 
-from .config import ServiceConfig, get_env_value, normalize_host, resolve_service_config
+from .config import (
+    ServiceConfig,
+    get_env_value,
+    is_port_open,
+    normalize_host,
+    resolve_service_config,
+)
 from .docker import (
     is_container_running,
     resolve_container_name,
@@ -20,11 +26,15 @@ from .logging import HumanFormatter, StructuredFormatter, setup_logging
 # Lazy imports for neo4j/milvus - only load when accessed
 _neo4j_names = {
     "Neo4jConfig",
+    "close_shared_neo4j_drivers",
+    "execute_cypher_file",
     "get_neo4j_config",
     "get_neo4j_driver",
+    "get_shared_neo4j_driver",
     "is_neo4j_available",
     "load_cypher_file",
     "run_cypher_query",
+    "split_cypher_statements",
     "wait_for_neo4j",
 }
 _milvus_names = {
@@ -56,13 +66,17 @@ __all__ = [
     "ServiceConfig",
     "ServiceHealth",
     "StructuredFormatter",
+    "close_shared_neo4j_drivers",
+    "execute_cypher_file",
     "get_env_value",
     "get_milvus_config",
     "get_neo4j_config",
     "get_neo4j_driver",
+    "get_shared_neo4j_driver",
     "is_container_running",
     "is_milvus_running",
     "is_neo4j_available",
+    "is_port_open",
     "load_cypher_file",
     "load_stack_env",
     "normalize_host",
@@ -70,6 +84,7 @@ __all__ = [
     "resolve_service_config",
     "run_cypher_query",
     "setup_logging",
+    "split_cypher_statements",
     "wait_for_container_health",
     "wait_for_milvus",
     "wait_for_neo4j",
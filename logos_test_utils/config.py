@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import socket
 from collections.abc import Mapping
 from dataclasses import dataclass
 
@@ -24,6 +25,21 @@ def normalize_host(host: str) -> str:
     return "localhost" if host == "0.0.0.0" else host
 
 
+def is_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
+    """Return whether a TCP connection to ``host:port`` succeeds in time.
+
+    A cheap pre-check for service probes: a refused or black-holed port fails
+    here within ``timeout`` instead of waiting out a client library's own
+    (much longer) connect timeout.
+    """
+
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 @dataclass(frozen=True)
 class ServiceConfig:
     host: str
@@ -25,10 +25,18 @@ def resolve_container_name(
 
 
 def is_container_running(container_name: str) -> bool:
-    """Check whether the given Docker container name is currently running."""
+    """Check whether the given Docker container name is currently running.
+
+    Each call asks ``docker ps`` afresh; callers that check repeatedly should
+    keep the answer themselves (the test suites check once per module). Set
+    ``LOGOS_SKIP_DOCKER_CHECK=1`` to report every container as running without
+    calling Docker, for environments whose stack was verified by other means.
+    """
 
     if not container_name:
         return False
+    if os.environ.get("LOGOS_SKIP_DOCKER_CHECK") == "1":
+        return True
 
     try:
         result = subprocess.run(
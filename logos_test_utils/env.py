@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from collections.abc import Mapping
 from pathlib import Path
@@ -39,5 +40,14 @@ def get_repo_root(env: Mapping[str, str] | None = None) -> Path:
     1. LOGOS_REPO_ROOT from OS env or provided mapping (if path exists).
     2. GITHUB_WORKSPACE (set by GitHub Actions in CI).
     3. Fallback to parent of this package (works when running from source).
+
+    The default lookup (no ``env`` mapping) is resolved once per process.
     """
+    if env is None:
+        return _default_repo_root()
     return resolve_repo_root("logos", env)
+
+
+@functools.cache
+def _default_repo_root() -> Path:
+    return resolve_repo_root("logos")
@@ -7,7 +7,12 @@ from dataclasses import dataclass
 
 from logos_config import get_repo_ports
 
-from .config import ServiceConfig, get_env_value, resolve_service_config
+from .config import (
+    ServiceConfig,
+    get_env_value,
+    is_port_open,
+    resolve_service_config,
+)
 from .docker import (
     is_container_running,
     resolve_container_name,
@@ -67,6 +72,10 @@ def is_milvus_running(config: MilvusConfig | None = None) -> bool:
     return is_container_running(cfg.container)
 
 
+# Configs whose Milvus endpoint has accepted a probe connection in this process.
+_AVAILABLE_CONFIGS: set[MilvusConfig] = set()
+
+
 def is_milvus_available(
     config: MilvusConfig | None = None, timeout: float = 2.0
 ) -> bool:
@@ -76,9 +85,23 @@ def is_milvus_available(
     container by name, this opens a real gRPC connection. Tests should gate on
     *reachability* of the service (which works in CI compose, the shared test
     stack, or a remote Milvus) rather than on a specific local container name.
+    A successful probe is remembered per config for the life of the process;
+    failures are not, so a Milvus that comes up later is noticed.
     """
 
     cfg = config or get_milvus_config()
+    if cfg in _AVAILABLE_CONFIGS:
+        return True
+    if not _probe_milvus(cfg, timeout):
+        return False
+    _AVAILABLE_CONFIGS.add(cfg)
+    return True
+
+
+def _probe_milvus(cfg: MilvusConfig, timeout: float) -> bool:
+    # Skip importing pymilvus and its gRPC handshake when nothing listens.
+    if not is_port_open(cfg.host, cfg.port, timeout=min(timeout, 0.5)):
+        return False
     try:
         from pymilvus import connections
     except ImportError:
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import re
 import subprocess
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
 
-from neo4j import GraphDatabase
+from neo4j import Driver, GraphDatabase, unit_of_work
 from neo4j.exceptions import ServiceUnavailable
 
 from logos_config import get_repo_ports
 
-from .config import ServiceConfig, get_env_value, resolve_service_config
+from .config import (
+    ServiceConfig,
+    get_env_value,
+    is_port_open,
+    resolve_service_config,
+)
 from .docker import resolve_container_name, wait_for_container_health
 
 
@@ -50,39 +61,111 @@ def get_neo4j_config(
     return Neo4jConfig(uri=uri, user=user, password=password, container=container)
 
 
-def get_neo4j_driver(config: Neo4jConfig | None = None):
-    """Create a Neo4j driver for the configured instance."""
+def get_neo4j_driver(config: Neo4jConfig | None = None, **driver_options: Any):
+    """Create a Neo4j driver for the configured instance.
+
+    ``driver_options`` are passed through to ``GraphDatabase.driver``.
+    """
+
+    cfg = config or get_neo4j_config()
+    return GraphDatabase.driver(
+        cfg.uri, auth=(cfg.user, cfg.password), **driver_options
+    )
+
+
+_SHARED_DRIVERS: dict[tuple[str, str, str], Driver] = {}
+# Configs whose Bolt endpoint has answered a probe in this process.
+_AVAILABLE_CONFIGS: set[Neo4jConfig] = set()
+
+# Each pytest process (one per xdist worker) runs one test at a time, so the
+# shared pool never needs the driver's default of 100 connections. Short
+# connect/acquire timeouts make a wedged server fail tests instead of hanging.
+_SHARED_DRIVER_OPTIONS: dict[str, Any] = {
+    "max_connection_pool_size": 4,
+    "connection_acquisition_timeout": 10.0,
+    "connection_timeout": 5.0,
+}
+
+
+def get_shared_neo4j_driver(config: Neo4jConfig | None = None) -> Driver:
+    """Return a process-wide Neo4j driver for the configured instance.
+
+    Drivers are cached on ``(uri, user, password)`` so every test module in a
+    run reuses one connection pool. Callers must not close the returned
+    driver; cached drivers are closed once at interpreter exit.
+    """
 
     cfg = config or get_neo4j_config()
-    return GraphDatabase.driver(cfg.uri, auth=(cfg.user, cfg.password))
+    key = (cfg.uri, cfg.user, cfg.password)
+    driver = _SHARED_DRIVERS.get(key)
+    if driver is None:
+        driver = get_neo4j_driver(cfg, **_SHARED_DRIVER_OPTIONS)
+        _SHARED_DRIVERS[key] = driver
+    return driver
+
+
+def close_shared_neo4j_drivers() -> None:
+    """Close and forget every driver handed out by ``get_shared_neo4j_driver``."""
+
+    while _SHARED_DRIVERS:
+        _, driver = _SHARED_DRIVERS.popitem()
+        driver.close()
+
+
+atexit.register(close_shared_neo4j_drivers)
 
 
 def is_neo4j_available(config: Neo4jConfig | None = None) -> bool:
-    """Quick connectivity probe for Neo4j."""
+    """Quick connectivity probe for Neo4j.
+
+    The probe runs on the shared driver, so gating a module on it does not
+    build a throwaway connection pool before the module's fixtures reuse it.
+    A successful probe is remembered per config for the life of the process,
+    so every module that gates on a running Neo4j shares one round-trip.
+    Failures are not remembered: the next call probes again, and a closed Bolt
+    port is detected by a short TCP check before any driver is involved.
+    """
 
     cfg = config or get_neo4j_config()
+    if cfg in _AVAILABLE_CONFIGS:
+        return True
+    if not _probe_neo4j(cfg):
+        return False
+    _AVAILABLE_CONFIGS.add(cfg)
+    return True
+
+
+def _bolt_port_open(uri: str) -> bool:
+    parts = urlsplit(uri)
+    return is_port_open(parts.hostname or "localhost", parts.port or 7687)
+
+
+def _probe_neo4j(cfg: Neo4jConfig) -> bool:
+    if not _bolt_port_open(cfg.uri):
+        return False
     try:
-        driver = get_neo4j_driver(cfg)
-        with driver.session() as session:
+        with get_shared_neo4j_driver(cfg).session() as session:
             session.run("RETURN 1 AS test").single()
-        driver.close()
         return True
     except (ServiceUnavailable, OSError):
         return False
 
 
-def _cypher_shell_command(config: Neo4jConfig) -> list[str]:
-    return [
+@functools.lru_cache(maxsize=8)
+def _cypher_shell_command(config: Neo4jConfig) -> tuple[str, ...]:
+    return (
         "docker",
         "exec",
         "-i",
         config.container,
         "cypher-shell",
+        "--format",
+        "plain",
         "-u",
         config.user,
         "-p",
         config.password,
-    ]
+    )
 
 
 def run_cypher_query(
@@ -94,7 +177,7 @@ def run_cypher_query(
 
     cfg = config or get_neo4j_config()
     return subprocess.run(  # noqa: S603,S607 (trusted input for test infra)
-        _cypher_shell_command(cfg) + [query],
+        (*_cypher_shell_command(cfg), query),
         capture_output=True,
         text=True,
         timeout=timeout,
@@ -107,7 +190,11 @@ def load_cypher_file(
     config: Neo4jConfig | None = None,
     timeout: int = 60,
 ) -> subprocess.CompletedProcess[str]:
-    """Pipe the contents of a Cypher file into ``cypher-shell``."""
+    """Pipe the contents of a Cypher file into ``cypher-shell``.
+
+    Test suites that already hold a Bolt connection should prefer
+    :func:`execute_cypher_file`, which needs no local container.
+    """
 
     cfg = config or get_neo4j_config()
     path = Path(file_path)
@@ -122,6 +209,82 @@ def load_cypher_file(
         )
 
 
+_STATEMENT_END = re.compile(r";[ \t]*$", re.MULTILINE)
+
+
+def split_cypher_statements(text: str) -> list[str]:
+    """Split a ``.cypher`` script into statements for ``session.run``.
+
+    Full-line ``//`` comments are dropped and statements are split on a ``;``
+    that ends a line, which is how the ``ontology/`` scripts are laid out.
+    """
+
+    body = "\n".join(
+        line for line in text.splitlines() if not line.lstrip().startswith("//")
+    )
+    return [stmt.strip() for stmt in _STATEMENT_END.split(body) if stmt.strip()]
+
+
+# Records the SHA-256 of each script loaded into the graph, keyed on file name.
+# The constraint stops concurrent loaders (e.g. xdist workers) from MERGEing
+# duplicate fingerprint nodes; schema changes need their own transaction.
+_FINGERPRINT_CONSTRAINT_CYPHER = (
+    "CREATE CONSTRAINT logos_meta_script IF NOT EXISTS "
+    "FOR (m:LogosMeta) REQUIRE m.script IS UNIQUE"
+)
+_LOADED_FINGERPRINT_CYPHER = """
+OPTIONAL MATCH (m:LogosMeta {script: $script})
+RETURN m.sha256 = $sha256
+       AND EXISTS { MATCH (:Node {uuid: $sentinel_uuid}) } AS loaded
+"""
+_RECORD_FINGERPRINT_CYPHER = (
+    "MERGE (m:LogosMeta {script: $script}) SET m.sha256 = $sha256"
+)
+
+
+def execute_cypher_file(
+    file_path: str | Path,
+    config: Neo4jConfig | None = None,
+    timeout: float = 120,
+    sentinel_uuid: str | None = None,
+) -> bool:
+    """Run a ``.cypher`` script over Bolt as a single write transaction.
+
+    The statements share one transaction on the shared driver and commit once,
+    so a failure rolls the whole file back instead of leaving it half-loaded;
+    the driver's exception (e.g. ``Neo4jError``) propagates to the caller.
+    The file's SHA-256 is recorded on a ``:LogosMeta`` node in the same
+    transaction.
+
+    By default the script always runs. Pass ``sentinel_uuid`` (the uuid of a
+    ``:Node`` the script creates) to skip it when the recorded SHA-256 matches
+    *and* that node still exists, so a graph whose data was deleted but whose
+    ``:LogosMeta`` node survived is reloaded. Returns ``True`` if the script
+    ran and ``False`` if it was skipped.
+    """
+
+    path = Path(file_path)
+    script = path.read_bytes()
+    params = {"script": path.name, "sha256": hashlib.sha256(script).hexdigest()}
+
+    @unit_of_work(timeout=timeout)
+    def _load(tx) -> bool:
+        if sentinel_uuid is not None:
+            check = tx.run(
+                _LOADED_FINGERPRINT_CYPHER, params, sentinel_uuid=sentinel_uuid
+            )
+            if check.single()["loaded"] is True:
+                return False
+        for statement in split_cypher_statements(script.decode("utf-8")):
+            tx.run(statement).consume()
+        tx.run(_RECORD_FINGERPRINT_CYPHER, params).consume()
+        return True
+
+    with get_shared_neo4j_driver(config).session() as session:
+        session.run(_FINGERPRINT_CONSTRAINT_CYPHER).consume()
+        return session.execute_write(_load)
+
+
 def wait_for_neo4j(config: Neo4jConfig | None = None, timeout: int = 90) -> None:
     """Wait for the Neo4j container to report healthy and accept connections."""
 
@@ -0,0 +1,55 @@
+"""Helpers for running LOGOS test suites under pytest-xdist.
+
+pytest-xdist is optional. Without it every helper degrades to serial
+behaviour, reporting a single ``master`` worker.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+def get_worker_id() -> str:
+    """Return the xdist worker id (``gw0``, ``gw1``...) or ``master``."""
+
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_shared_tmp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a temp directory visible to every worker of the current run."""
+
+    basetemp = tmp_path_factory.getbasetemp()
+    return basetemp if get_worker_id() == "master" else basetemp.parent
+
+
+def run_once_per_session(
+    tmp_path_factory: pytest.TempPathFactory,
+    name: str,
+    setup: Callable[[], object],
+) -> None:
+    """Run ``setup`` once per test run, even when split across xdist workers.
+
+    The first worker to take the file lock runs ``setup`` and drops a marker;
+    the others wait on the lock and return once the marker exists. If
+    ``setup`` raises, no marker is written and the next worker retries.
+    """
+
+    if get_worker_id() == "master":
+        setup()
+        return
+
+    shared_dir = get_shared_tmp_dir(tmp_path_factory)
+    marker = shared_dir / f"{name}.done"
+    with (shared_dir / f"{name}.lock").open("w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if not marker.exists():
+                setup()
+                marker.touch()
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
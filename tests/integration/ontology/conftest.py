@@ -0,0 +1,179 @@
+"""
+Shared fixtures for the ontology integration suites (M1 CRUD, M2 SHACL).
+
+Every module here talks to the same Neo4j instance, so they share one
+session-scoped driver (and therefore one Bolt connection pool) per run.
+Reachability is probed once at collection time; only tests that need the
+driver are skipped when Neo4j is down.
+The pyshacl suites likewise share one parse of the shapes and fixture files.
+
+The pyshacl suites are CPU-bound and can be split across cores with
+pytest-xdist (``pytest -n auto tests/integration/ontology``). Each worker is
+its own process and builds its own session graphs, so nothing is shared
+between workers; ``shacl_validator`` explains why sharing them within a worker
+is safe.
+"""
+
+import functools
+from pathlib import Path
+
+import pytest
+from pyshacl import Validator
+from rdflib import Graph
+
+from logos_test_utils.env import get_repo_root
+from logos_test_utils.neo4j import (
+    get_neo4j_config,
+    get_shared_neo4j_driver,
+    is_neo4j_available,
+)
+
+NEO4J_CONFIG = get_neo4j_config()
+HERE = Path(__file__).parent
+FIXTURES_DIR = HERE / "fixtures"
+SHACL_SHAPES_FILE = get_repo_root() / "ontology" / "shacl_shapes.ttl"
+VALID_ENTITIES_FILE = FIXTURES_DIR / "valid_entities.ttl"
+INVALID_ENTITIES_FILE = FIXTURES_DIR / "invalid_entities.ttl"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the Neo4j-backed tests in this directory if Neo4j is unreachable.
+
+    Gates on Bolt reachability rather than a local container name, so the
+    tests run wherever Neo4j is reachable (CI compose, the shared test stack
+    or a remote instance). pyshacl-only tests are left alone.
+    """
+    needs_neo4j = [
+        item
+        for item in items
+        if item.path.is_relative_to(HERE) and "neo4j_driver" in item.fixturenames
+    ]
+    if not needs_neo4j or is_neo4j_available(NEO4J_CONFIG):
+        return
+
+    skip = pytest.mark.skip(
+        reason=f"Neo4j not reachable at {NEO4J_CONFIG.uri}. "
+        "Start the stack with: ./tests/e2e/run_e2e.sh up"
+    )
+    for item in needs_neo4j:
+        item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def neo4j_driver():
+    """Provide the process-wide Neo4j driver.
+
+    Tests using it are skipped at collection time when Neo4j is unreachable.
+    The driver is owned by ``logos_test_utils.neo4j`` and closed at exit.
+    """
+    return get_shared_neo4j_driver(NEO4J_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def n10s_procedures(neo4j_driver):
+    """Names of the installed n10s procedures, listed once per run.
+
+    ``SHOW PROCEDURES`` walks the whole procedure registry, and the set of
+    installed plugins cannot change mid-run, so every capability check shares
+    this one lookup. Empty when n10s is not installed.
+    """
+    with neo4j_driver.session(database="neo4j") as session:
+        record = session.run(
+            "SHOW PROCEDURES YIELD name WHERE name STARTS WITH 'n10s' "
+            "RETURN collect(name) AS names"
+        ).single()
+    return frozenset(record["names"])
+
+
+@pytest.fixture(scope="session")
+def shacl_shapes():
+    """Load SHACL shapes from ontology directory.
+
+    An empty shapes file errors every dependent test at setup, since an empty
+    shapes graph would let any data graph conform.
+    """
+    shapes = Graph().parse(SHACL_SHAPES_FILE, format="turtle")
+    assert len(shapes) > 0, f"SHACL shapes graph is empty: {SHACL_SHAPES_FILE}"
+    return shapes
+
+
+@pytest.fixture(scope="session")
+def shacl_shapes_text():
+    """Raw Turtle of the SHACL shapes, for suites that send it to n10s."""
+    return SHACL_SHAPES_FILE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def valid_entities_text():
+    """Raw Turtle of the valid fixture entities."""
+    return VALID_ENTITIES_FILE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def invalid_entities_text():
+    """Raw Turtle of the invalid fixture entities."""
+    return INVALID_ENTITIES_FILE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def valid_data():
+    """Load valid test data."""
+    return Graph().parse(VALID_ENTITIES_FILE, format="turtle")
+
+
+@pytest.fixture(scope="session")
+def invalid_data():
+    """Load invalid test data."""
+    return Graph().parse(INVALID_ENTITIES_FILE, format="turtle")
+
+
+@pytest.fixture(scope="session")
+def turtle_graph():
+    """Return a parser that builds each inline Turtle snippet's graph once.
+
+    Keyed on the literal source text, so a snippet shared by several cases is
+    parsed once and the graph reused like the other session graphs.
+    """
+
+    @functools.cache
+    def _parse(source: str) -> Graph:
+        return Graph().parse(data=source, format="turtle")
+
+    return _parse
+
+
+@pytest.fixture(scope="session")
+def shacl_validator(shacl_shapes):
+    """Return a ``validate()``-like callable that harvests the shapes once.
+
+    ``pyshacl.validate()`` wraps the shapes in a fresh ``ShapesGraph`` on every
+    call and re-harvests its node and property shapes. This keeps the first
+    ``ShapesGraph`` and hands it to a new ``Validator`` per data graph. The
+    callable returns ``(conforms, report_graph, report_text)``.
+
+    This is what makes the session graphs safe to share. Validation runs with
+    ``inplace=False`` and ``inference="none"``, so pyshacl never writes into a
+    data graph. No RDFS inference is needed: the shapes only target
+    ``logos:Node`` and every fixture types its nodes explicitly. The harvested
+    ``ShapesGraph`` only caches idempotent shape lookups.
+    """
+    harvested = None
+
+    def _validate(data_graph, abort_on_first=False):
+        nonlocal harvested
+        validator = Validator(
+            data_graph,
+            shacl_graph=shacl_shapes,
+            options={
+                "inference": "none",
+                "abort_on_first": abort_on_first,
+                "inplace": False,
+            },
+        )
+        if harvested is None:
+            harvested = validator.shacl_graph
+        else:
+            validator.shacl_graph = harvested
+        return validator.run()
+
+    return _validate
@@ -9,6 +9,12 @@ Tests the M1 milestone requirements with FLEXIBLE ONTOLOGY:
 - Traverse relationships (type lookup, current state, causal chains)
 - Fail on constraint violations
 
+Tests use uuid4-scoped identifiers, so the module is safe to run with
+``pytest -n auto``; fixture data is loaded by a single xdist worker. Setup
+only removes nodes left behind by earlier runs of this module, never the
+whole graph, so it cannot undo data other suites (e.g. the M4 end-to-end
+test) seeded into the same database.
+
 FLEXIBLE ONTOLOGY:
 All nodes use the :Node label with these properties:
 - uuid: unique identifier
@@ -21,76 +27,92 @@ Reference: docs/PHASE1_VERIFY.md - M1 checklist
 Reference: docs/plans/2025-12-30-flexible-ontology-design.md
 """
 
+from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
-from neo4j.exceptions import ClientError
+from neo4j import unit_of_work
+from neo4j.exceptions import ClientError, Neo4jError
 
 from logos_test_utils.env import get_repo_root
-from logos_test_utils.neo4j import (
-    get_neo4j_config,
-    get_neo4j_driver,
-    is_neo4j_available,
-    load_cypher_file,
-)
+from logos_test_utils.neo4j import execute_cypher_file, get_neo4j_config
+from logos_test_utils.xdist import run_once_per_session
 
 NEO4J_CONFIG = get_neo4j_config()
-REPO_ROOT = get_repo_root()
-
-# Gate on actual Bolt reachability, not on a local Docker container name.
-# This lets the test run wherever Neo4j is reachable -- CI compose, the shared
-# test stack, or a remote instance -- instead of silently skipping when no
-# local container matches NEO4J_CONTAINER.
-if not is_neo4j_available(NEO4J_CONFIG):
-    pytest.skip(
-        f"Neo4j not reachable at {NEO4J_CONFIG.uri}. "
-        "Start the stack with: ./tests/e2e/run_e2e.sh up",
-        allow_module_level=True,
-    )
-
-
-@pytest.fixture(scope="module")
-def neo4j_driver():
-    """Provide a Neo4j driver tied to the shared stack."""
+CONSTRAINT_VIOLATION_CODE = "Neo.ClientError.Schema.ConstraintValidationFailed"
+# RobotArm01 from test_data_pick_and_place.cypher; while it exists (and the
+# script is unchanged) the test data does not need reloading.
+TEST_DATA_SENTINEL_UUID = "c551e7ad-c12a-40bc-8c29-3a721fa311cb"
+# Every node a test here creates has a uuid starting with one of these.
+TEST_UUID_PREFIXES = [
+    "entity-test-",
+    "concept-test-",
+    "type-test-",
+    "state-test-",
+    "process-test-",
+]
+CLEAR_TEST_NODES_CYPHER = """
+MATCH (n:Node)
+WHERE any(prefix IN $prefixes WHERE n.uuid STARTS WITH prefix)
+DETACH DELETE n
+"""
 
-    driver = get_neo4j_driver(NEO4J_CONFIG)
-    yield driver
-    driver.close()
+# Skipped by the ontology conftest when Neo4j is unreachable; every test here
+# depends on the neo4j_driver fixture.
 
 
 @pytest.fixture(scope="module")
-def loaded_ontology(neo4j_driver):
+def loaded_ontology(neo4j_driver, tmp_path_factory):
     """Seed the type skeleton into Neo4j before tests.
 
     Replaces the retired ``core_ontology.cypher`` bootstrap (logos#515) with the
-    HCG seeder, which is now the single source of the type skeleton.
+    HCG seeder, which is now the single source of the type skeleton. Under
+    pytest-xdist only the first worker seeds; the rest wait on a file lock.
     """
     from logos_hcg.client import HCGClient
     from logos_hcg.seeder import HCGSeeder
 
-    # First, clean the database
-    with neo4j_driver.session() as session:
-        session.run("MATCH (n) DETACH DELETE n")
-
-    client = HCGClient(
-        uri=NEO4J_CONFIG.uri,
-        user=NEO4J_CONFIG.user,
-        password=NEO4J_CONFIG.password,
-    )
-    try:
-        HCGSeeder(client).seed_type_definitions()
-    finally:
-        client.close()
+    def _seed() -> None:
+        # Drop nodes an interrupted earlier run failed to clean up
+        with neo4j_driver.session() as session:
+            session.run(CLEAR_TEST_NODES_CYPHER, prefixes=TEST_UUID_PREFIXES)
+
+        client = HCGClient(
+            uri=NEO4J_CONFIG.uri,
+            user=NEO4J_CONFIG.user,
+            password=NEO4J_CONFIG.password,
+        )
+        try:
+            HCGSeeder(client).seed_type_definitions()
+        finally:
+            client.close()
+
+    run_once_per_session(tmp_path_factory, "m1_loaded_ontology", _seed)
     return True
 
 
 @pytest.fixture(scope="module")
-def loaded_test_data(neo4j_driver, loaded_ontology):
-    """Load test data into Neo4j before tests."""
-    test_data_path = REPO_ROOT / "ontology" / "test_data_pick_and_place.cypher"
-    result = load_cypher_file(test_data_path, config=NEO4J_CONFIG, timeout=120)
-    if result.returncode != 0:
-        pytest.fail(f"Failed to load test data: {result.stderr}")
+def loaded_test_data(loaded_ontology, tmp_path_factory):
+    """Load test data into Neo4j before tests.
+
+    Must run after ``loaded_ontology``: that fixture creates the
+    ``logos_node_uuid`` constraint the test data's MERGEs rely on.
+    """
+
+    def _load() -> None:
+        test_data_path = (
+            get_repo_root() / "ontology" / "test_data_pick_and_place.cypher"
+        )
+        try:
+            execute_cypher_file(
+                test_data_path,
+                config=NEO4J_CONFIG,
+                sentinel_uuid=TEST_DATA_SENTINEL_UUID,
+            )
+        except Neo4jError as exc:
+            pytest.fail(f"Failed to load test data: {exc}")
+
+    run_once_per_session(tmp_path_factory, "m1_loaded_test_data", _load)
     return True
 
 
@@ -108,8 +130,7 @@ class TestOntologyLoading:
     def test_constraints_exist(self, neo4j_driver, loaded_ontology):
         """Verify UUID constraint on :Node label exists (flexible ontology)."""
         with neo4j_driver.session() as session:
-            result = session.run("SHOW CONSTRAINTS")
-            constraints = [record["name"] for record in result]
+            constraints = session.run("SHOW CONSTRAINTS YIELD name RETURN name").value()
 
             # Check for flexible ontology constraint (single UUID constraint on :Node)
             assert any(
@@ -119,8 +140,7 @@ class TestOntologyLoading:
     def test_indexes_exist(self, neo4j_driver, loaded_ontology):
         """Verify indexes for flexible ontology exist."""
         with neo4j_driver.session() as session:
-            result = session.run("SHOW INDEXES")
-            indexes = [record["name"] for record in result]
+            indexes = session.run("SHOW INDEXES YIELD name RETURN name").value()
 
             # Check for flexible ontology indexes
             assert any(
@@ -150,11 +170,12 @@ class TestEntityCreation:
                     is_type_definition: false,
                     type: 'entity',
                     ancestors: ['entity', 'thing'],
-                    created_at: datetime()
+                    created_at: $ts
                 }) RETURN e
                 """,
                 uuid=test_uuid,
                 name="TestEntity01",
+                ts=datetime.now(UTC),
             )
             entity = result.single()
             assert entity is not None
@@ -201,10 +222,7 @@ class TestEntityCreation:
                     name="TestEntity02",
                 )
 
-            assert (
-                "ConstraintValidationFailed" in str(exc_info.value)
-                or "already exists" in str(exc_info.value).lower()
-            )
+            assert exc_info.value.code == CONSTRAINT_VIOLATION_CODE
 
             # Cleanup
             session.run("MATCH (e:Node {uuid: $uuid}) DELETE e", uuid=test_uuid)
@@ -285,10 +303,11 @@ class TestStateCreation:
                     is_type_definition: false,
                     type: 'state',
                     ancestors: ['state', 'concept'],
-                    timestamp: datetime()
+                    timestamp: $ts
                 }) RETURN s
                 """,
                 uuid=test_uuid,
+                ts=datetime.now(UTC),
             )
             state = result.single()
             assert state is not None
@@ -313,10 +332,11 @@ class TestStateCreation:
                     is_type_definition: false,
                     type: 'state',
                     ancestors: ['state', 'concept'],
-                    timestamp: datetime()
+                    timestamp: $ts
                 })
                 """,
                 uuid=test_uuid,
+                ts=datetime.now(UTC),
             )
 
             # Try to create duplicate
@@ -329,16 +349,14 @@ class TestStateCreation:
                         is_type_definition: false,
                         type: 'state',
                         ancestors: ['state', 'concept'],
-                        timestamp: datetime()
+                        timestamp: $ts
                     })
                     """,
                     uuid=test_uuid,
+                    ts=datetime.now(UTC),
                 )
 
-            assert (
-                "ConstraintValidationFailed" in str(exc_info.value)
-                or "already exists" in str(exc_info.value).lower()
-            )
+            assert exc_info.value.code == CONSTRAINT_VIOLATION_CODE
 
             # Cleanup
             session.run("MATCH (s:Node {uuid: $uuid}) DELETE s", uuid=test_uuid)
@@ -360,10 +378,11 @@ class TestProcessCreation:
                     is_type_definition: false,
                     type: 'process',
                     ancestors: ['process', 'concept'],
-                    start_time: datetime()
+                    start_time: $ts
                 }) RETURN p
                 """,
                 uuid=test_uuid,
+                ts=datetime.now(UTC),
             )
             process = result.single()
             assert process is not None
@@ -388,10 +407,11 @@ class TestProcessCreation:
                     is_type_definition: false,
                     type: 'process',
                     ancestors: ['process', 'concept'],
-                    start_time: datetime()
+                    start_time: $ts
                 })
                 """,
                 uuid=test_uuid,
+                ts=datetime.now(UTC),
             )
 
             # Try to create duplicate
@@ -404,23 +424,183 @@ class TestProcessCreation:
                         is_type_definition: false,
                         type: 'process',
                         ancestors: ['process', 'concept'],
-                        start_time: datetime()
+                        start_time: $ts
                     })
                     """,
                     uuid=test_uuid,
+                    ts=datetime.now(UTC),
                 )
 
-            assert (
-                "ConstraintValidationFailed" in str(exc_info.value)
-                or "already exists" in str(exc_info.value).lower()
-            )
+            assert exc_info.value.code == CONSTRAINT_VIOLATION_CODE
 
             # Cleanup
             session.run("MATCH (p:Node {uuid: $uuid}) DELETE p", uuid=test_uuid)
 
 
+@unit_of_work(timeout=10, metadata={"test": __name__, "tx": "create_is_a"})
+def _create_is_a(tx, entity_uuid, type_uuid, type_name):
+    """Create an entity, its type definition and the IS_A edge in one tx."""
+    tx.run(
+        """
+        CREATE (e:Node {
+            uuid: $e_uuid,
+            name: $e_name,
+            is_type_definition: false,
+            type: $type_name,
+            ancestors: [$type_name, 'thing']
+        })
+        """,
+        e_uuid=entity_uuid,
+        e_name="TestEntity",
+        type_name=type_name,
+    )
+    tx.run(
+        """
+        CREATE (t:Node {
+            uuid: $t_uuid,
+            name: $t_name,
+            is_type_definition: true,
+            type: $t_name,
+            ancestors: ['thing']
+        })
+        """,
+        t_uuid=type_uuid,
+        t_name=type_name,
+    )
+    return tx.run(
+        """
+        MATCH (e:Node {uuid: $e_uuid})
+        MATCH (t:Node {uuid: $t_uuid})
+        CREATE (e)-[r:IS_A]->(t)
+        RETURN r
+        """,
+        e_uuid=entity_uuid,
+        t_uuid=type_uuid,
+    ).single()
+
+
+@unit_of_work(timeout=10, metadata={"test": __name__, "tx": "create_has_state"})
+def _create_has_state(tx, entity_uuid, state_uuid):
+    """Create an entity, a state and the HAS_STATE edge in one tx."""
+    tx.run(
+        """
+        CREATE (e:Node {
+            uuid: $e_uuid,
+            name: $e_name,
+            is_type_definition: false,
+            type: 'entity',
+            ancestors: ['entity', 'thing']
+        })
+        """,
+        e_uuid=entity_uuid,
+        e_name="TestEntity",
+    )
+    tx.run(
+        """
+        CREATE (s:Node {
+            uuid: $s_uuid,
+            name: 'TestState',
+            is_type_definition: false,
+            type: 'state',
+            ancestors: ['state', 'concept'],
+            timestamp: $ts
+        })
+        """,
+        s_uuid=state_uuid,
+        ts=datetime.now(UTC),
+    )
+    return tx.run(
+        """
+        MATCH (e:Node {uuid: $e_uuid})
+        MATCH (s:Node {uuid: $s_uuid})
+        CREATE (e)-[r:HAS_STATE]->(s)
+        RETURN r
+        """,
+        e_uuid=entity_uuid,
+        s_uuid=state_uuid,
+    ).single()
+
+
+@unit_of_work(timeout=10, metadata={"test": __name__, "tx": "create_causes"})
+def _create_causes(tx, process_uuid, state_uuid):
+    """Create a process, a state and the CAUSES edge in one tx."""
+    tx.run(
+        """
+        CREATE (p:Node {
+            uuid: $p_uuid,
+            name: 'TestProcess',
+            is_type_definition: false,
+            type: 'process',
+            ancestors: ['process', 'concept'],
+            start_time: $ts
+        })
+        """,
+        p_uuid=process_uuid,
+        ts=datetime.now(UTC),
+    )
+    tx.run(
+        """
+        CREATE (s:Node {
+            uuid: $s_uuid,
+            name: 'TestState',
+            is_type_definition: false,
+            type: 'state',
+            ancestors: ['state', 'concept'],
+            timestamp: $ts
+        })
+        """,
+        s_uuid=state_uuid,
+        ts=datetime.now(UTC),
+    )
+    return tx.run(
+        """
+        MATCH (p:Node {uuid: $p_uuid})
+        MATCH (s:Node {uuid: $s_uuid})
+        CREATE (p)-[r:CAUSES]->(s)
+        RETURN r
+        """,
+        p_uuid=process_uuid,
+        s_uuid=state_uuid,
+    ).single()
+
+
+@unit_of_work(timeout=10, metadata={"test": __name__, "tx": "create_part_of"})
+def _create_part_of(tx, part_uuid, whole_uuid):
+    """Create two entities and the PART_OF edge between them in one tx."""
+    for e_uuid, e_name in ((part_uuid, "TestPart"), (whole_uuid, "TestWhole")):
+        tx.run(
+            """
+            CREATE (e:Node {
+                uuid: $e_uuid,
+                name: $e_name,
+                is_type_definition: false,
+                type: 'entity',
+                ancestors: ['entity', 'thing']
+            })
+            """,
+            e_uuid=e_uuid,
+            e_name=e_name,
+        )
+    return tx.run(
+        """
+        MATCH (part:Node {uuid: $part_uuid})
+        MATCH (whole:Node {uuid: $whole_uuid})
+        CREATE (part)-[r:PART_OF]->(whole)
+        RETURN r
+        """,
+        part_uuid=part_uuid,
+        whole_uuid=whole_uuid,
+    ).single()
+
+
 class TestRelationshipCreation:
-    """Test relationship creation between nodes (flexible ontology)."""
+    """Test relationship creation between nodes (flexible ontology).
+
+    Each test writes its nodes and edge in a single ``execute_write``
+    transaction, so the setup commits once instead of once per statement.
+    The transaction functions carry ``unit_of_work`` metadata, which Neo4j
+    reports in ``SHOW TRANSACTIONS`` and the query log to attribute DB time.
+    """
 
     def test_create_is_a_relationship(self, neo4j_driver, loaded_ontology):
         """Test creating IS_A relationship between Entity and type definition."""
@@ -429,48 +609,7 @@ class TestRelationshipCreation:
         type_name = f"TestType{uuid4().hex[:8]}"
 
         with neo4j_driver.session() as session:
-            # Create entity node
-            session.run(
-                """
-                CREATE (e:Node {
-                    uuid: $e_uuid,
-                    name: $e_name,
-                    is_type_definition: false,
-                    type: $type_name,
-                    ancestors: [$type_name, 'thing']
-                })
-                """,
-                e_uuid=entity_uuid,
-                e_name="TestEntity",
-                type_name=type_name,
-            )
-            # Create type definition node
-            session.run(
-                """
-                CREATE (t:Node {
-                    uuid: $t_uuid,
-                    name: $t_name,
-                    is_type_definition: true,
-                    type: $t_name,
-                    ancestors: ['thing']
-                })
-                """,
-                t_uuid=type_uuid,
-                t_name=type_name,
-            )
-
-            # Create relationship
-            result = session.run(
-                """
-                MATCH (e:Node {uuid: $e_uuid})
-                MATCH (t:Node {uuid: $t_uuid})
-                CREATE (e)-[r:IS_A]->(t)
-                RETURN r
-                """,
-                e_uuid=entity_uuid,
-                t_uuid=type_uuid,
-            )
-            rel = result.single()
+            rel = session.execute_write(_create_is_a, entity_uuid, type_uuid, type_name)
             assert rel is not None
 
             # Cleanup
@@ -487,47 +626,7 @@ class TestRelationshipCreation:
         state_uuid = f"state-test-{uuid4()}"
 
         with neo4j_driver.session() as session:
-            # Create entity node
-            session.run(
-                """
-                CREATE (e:Node {
-                    uuid: $e_uuid,
-                    name: $e_name,
-                    is_type_definition: false,
-                    type: 'entity',
-                    ancestors: ['entity', 'thing']
-                })
-                """,
-                e_uuid=entity_uuid,
-                e_name="TestEntity",
-            )
-            # Create state node
-            session.run(
-                """
-                CREATE (s:Node {
-                    uuid: $s_uuid,
-                    name: 'TestState',
-                    is_type_definition: false,
-                    type: 'state',
-                    ancestors: ['state', 'concept'],
-                    timestamp: datetime()
-                })
-                """,
-                s_uuid=state_uuid,
-            )
-
-            # Create relationship
-            result = session.run(
-                """
-                MATCH (e:Node {uuid: $e_uuid})
-                MATCH (s:Node {uuid: $s_uuid})
-                CREATE (e)-[r:HAS_STATE]->(s)
-                RETURN r
-                """,
-                e_uuid=entity_uuid,
-                s_uuid=state_uuid,
-            )
-            rel = result.single()
+            rel = session.execute_write(_create_has_state, entity_uuid, state_uuid)
             assert rel is not None
 
             # Cleanup
@@ -544,47 +643,7 @@ class TestRelationshipCreation:
         state_uuid = f"state-test-{uuid4()}"
 
         with neo4j_driver.session() as session:
-            # Create process node
-            session.run(
-                """
-                CREATE (p:Node {
-                    uuid: $p_uuid,
-                    name: 'TestProcess',
-                    is_type_definition: false,
-                    type: 'process',
-                    ancestors: ['process', 'concept'],
-                    start_time: datetime()
-                })
-                """,
-                p_uuid=process_uuid,
-            )
-            # Create state node
-            session.run(
-                """
-                CREATE (s:Node {
-                    uuid: $s_uuid,
-                    name: 'TestState',
-                    is_type_definition: false,
-                    type: 'state',
-                    ancestors: ['state', 'concept'],
-                    timestamp: datetime()
-                })
-                """,
-                s_uuid=state_uuid,
-            )
-
-            # Create relationship
-            result = session.run(
-                """
-                MATCH (p:Node {uuid: $p_uuid})
-                MATCH (s:Node {uuid: $s_uuid})
-                CREATE (p)-[r:CAUSES]->(s)
-                RETURN r
-                """,
-                p_uuid=process_uuid,
-                s_uuid=state_uuid,
-            )
-            rel = result.single()
+            rel = session.execute_write(_create_causes, process_uuid, state_uuid)
             assert rel is not None
 
             # Cleanup
@@ -601,47 +660,7 @@ class TestRelationshipCreation:
         whole_uuid = f"entity-test-whole-{uuid4()}"
 
         with neo4j_driver.session() as session:
-            # Create part entity node
-            session.run(
-                """
-                CREATE (e:Node {
-                    uuid: $e_uuid,
-                    name: $e_name,
-                    is_type_definition: false,
-                    type: 'entity',
-                    ancestors: ['entity', 'thing']
-                })
-                """,
-                e_uuid=part_uuid,
-                e_name="TestPart",
-            )
-            # Create whole entity node
-            session.run(
-                """
-                CREATE (e:Node {
-                    uuid: $e_uuid,
-                    name: $e_name,
-                    is_type_definition: false,
-                    type: 'entity',
-                    ancestors: ['entity', 'thing']
-                })
-                """,
-                e_uuid=whole_uuid,
-                e_name="TestWhole",
-            )
-
-            # Create relationship
-            result = session.run(
-                """
-                MATCH (part:Node {uuid: $part_uuid})
-                MATCH (whole:Node {uuid: $whole_uuid})
-                CREATE (part)-[r:PART_OF]->(whole)
-                RETURN r
-                """,
-                part_uuid=part_uuid,
-                whole_uuid=whole_uuid,
-            )
-            rel = result.single()
+            rel = session.execute_write(_create_part_of, part_uuid, whole_uuid)
             assert rel is not None
 
             # Cleanup
@@ -737,16 +756,17 @@ class TestRelationshipTraversal:
                 """
                 MATCH (part:Node)-[:PART_OF]->(whole:Node {uuid: 'c551e7ad-c12a-40bc-8c29-3a721fa311cb'})
                 WHERE 'thing' IN part.ancestors
-                RETURN part.name AS part_name
-                ORDER BY part.name
+                RETURN count(part) AS total,
+                       count(CASE WHEN part.name = 'Gripper01' THEN 1 END) AS grippers,
+                       count(CASE WHEN part.name CONTAINS 'Joint' THEN 1 END) AS joints
                 """
             )
-            parts = [record["part_name"] for record in result]
+            record = result.single()
 
             # Should include gripper and joints
-            assert "Gripper01" in parts
-            assert any("Joint" in p for p in parts)
-            assert len(parts) >= 4  # Gripper + at least 3 joints
+            assert record["grippers"] == 1
+            assert record["joints"] > 0
+            assert record["total"] >= 4  # Gripper + at least 3 joints
 
 
 class TestQueryOperations:
@@ -861,12 +881,13 @@ class TestQueryOperations:
                 """
                 MATCH (n:Node {type: 'Manipulator'})
                 WHERE n.is_type_definition = false
-                RETURN n.name AS name
+                RETURN count(n) AS total,
+                       count(CASE WHEN n.name = 'RobotArm01' THEN 1 END) AS robot_arms
                 """
             )
-            records = list(result)
-            assert len(records) > 0
-            assert any(r["name"] == "RobotArm01" for r in records)
+            record = result.single()
+            assert record["total"] > 0
+            assert record["robot_arms"] > 0
 
     def test_query_type_definitions(self, neo4j_driver, loaded_test_data):
         """Test querying type definitions vs instances."""
@@ -11,33 +11,72 @@ Tests that SHACL validation via Neo4j n10s correctly validates data:
 Reference: Phase 1 Gate c-daly/logos#163
 """
 
-import os
-from pathlib import Path
+import functools
+import logging
+from collections import defaultdict
 
 import pytest
-from neo4j import GraphDatabase
-from neo4j.exceptions import Neo4jError
-
-from logos_test_utils.env import get_repo_root
-
-
-@pytest.fixture(scope="module")
-def neo4j_driver():
-    """Create Neo4j driver for testing."""
-    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    user = os.getenv("NEO4J_USER", "neo4j")
-    password = os.getenv("NEO4J_PASSWORD", "neo4jtest")
-
-    driver = GraphDatabase.driver(uri, auth=(user, password))
-
-    # Test connection
-    try:
-        driver.verify_connectivity()
-    except Exception as e:
-        pytest.skip(f"Neo4j not available: {e}")
-
-    yield driver
-    driver.close()
+from rdflib import Graph, URIRef
+
+logger = logging.getLogger(__name__)
+
+# The shapes and fixture Turtle come from the session fixtures in conftest.py
+# (shacl_shapes_text, valid_entities_text, invalid_entities_text), which own
+# the file paths and read each file once per run.
+
+# Cypher issued from more than one place lives here so every call sends the
+# same parameterized text and reuses the server's cached plan for it.
+# Everything a test imports is tagged with a throwaway label, so cleanup is a
+# label lookup over the test's own nodes instead of a scan of the whole graph.
+TEST_DATA_LABEL = "_TestData"
+CLEAR_INSTANCE_CYPHER = f"MATCH (n:{TEST_DATA_LABEL}) DETACH DELETE n"
+TAG_IMPORTED_CYPHER = f"""
+MATCH (n:Resource) WHERE n.uri IN $uris
+OPTIONAL MATCH (n)-[*]->(b:Resource) WHERE b.uri STARTS WITH 'bnode://'
+WITH collect(n) + collect(b) AS imported
+UNWIND imported AS t
+SET t:{TEST_DATA_LABEL}
+"""
+COUNT_SHAPES_CYPHER = """
+CALL n10s.validation.shacl.listShapes()
+YIELD target
+RETURN count(*) AS n
+"""
+GRAPHCONFIG_INIT_CYPHER = (
+    "CALL n10s.graphconfig.init({"
+    "handleVocabUris:'KEEP',handleRDFTypes:'LABELS',"
+    "handleMultival:'ARRAY',keepLangTag:true})"
+)
+# Prefixes (or namespaces) n10s already knows are skipped: re-adding one
+# raises, and an error would roll back the whole setup transaction.
+ADD_PREFIXES_CYPHER = """
+CALL n10s.nsprefixes.list() YIELD prefix, namespace
+WITH collect(prefix) AS prefixes, collect(namespace) AS known
+UNWIND $namespaces AS ns
+WITH ns WHERE NOT ns.prefix IN prefixes AND NOT ns.uri IN known
+CALL n10s.nsprefixes.add(ns.prefix, ns.uri) YIELD prefix
+RETURN count(prefix) AS added
+"""
+NAMESPACES = {
+    "logos": "http://logos.ontology/",
+    "sh": "http://www.w3.org/ns/shacl#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+IMPORT_RDF_CYPHER = "CALL n10s.rdf.import.inline($rdf, 'Turtle')"
+VALIDATE_SET_CYPHER = """
+MATCH (n:Resource) WHERE n.uri IN $uris
+WITH collect(n) AS touched
+CALL n10s.validation.shacl.validateSet(touched)
+YIELD focusNode, nodeType, shapeId, propertyShape, offendingValue,
+      resultPath, severity, resultMessage
+RETURN focusNode, nodeType, shapeId, propertyShape, offendingValue,
+       resultPath, severity, resultMessage
+"""
+# Tests that only need to know whether violations exist stop the server after
+# a handful of rows instead of streaming the full report over Bolt.
+SAMPLE_VIOLATIONS = 5
 
 
 @pytest.fixture(scope="module")
@@ -47,151 +86,89 @@ def neo4j_session(neo4j_driver):
         yield session
 
 
-def _has_n10s(session):
-    """Return list of available n10s procedures."""
-    return [
-        p[0]
-        for p in session.run(
-            "SHOW PROCEDURES YIELD name WHERE name STARTS WITH 'n10s' RETURN name"
-        ).values()
-    ]
-
-
 def _clear_instance_data(session):
-    """Delete only user data, not SHACL shapes/config."""
-    session.run(
-        """
-        MATCH (n)
-        WHERE n:Node OR n.uuid IS NOT NULL
-        DETACH DELETE n
-        """
-    )
+    """Delete the nodes tests imported, not SHACL shapes/config."""
+    session.execute_write(lambda tx: tx.run(CLEAR_INSTANCE_CYPHER).consume())
 
 
-def _ensure_shapes(session, procedures):
-    """Ensure SHACL shapes are loaded; load from disk if missing."""
-    try:
-        shapes_count = len(
-            session.run("CALL n10s.validation.shacl.listShapes()").data()
-        )
-        if shapes_count > 0:
-            return
-    except Exception:
-        # If listShapes fails (e.g. "No shapes compiled"), assume we need to load them
-        pass
+def _prepare_n10s(tx, procedures, shapes_text):
+    """Configure n10s, register prefixes and load shapes in one transaction.
 
-    repo_root = get_repo_root()
-    shapes_file = repo_root / "ontology" / "shacl_shapes.ttl"
-
-    if not shapes_file.exists():
-        print(f"DEBUG: Shapes file not found at {shapes_file}")
-        return
-
-    shapes_text = shapes_file.read_text(encoding="utf-8")
+    Every step is a data write, so they pipeline into a single
+    ``execute_write`` instead of one auto-commit round-trip each. Shapes are
+    always reloaded rather than probed with ``listShapes()``, which raises
+    when nothing is compiled and would abort the transaction. Returns the
+    number of compiled shapes.
+    """
+    config = tx.run("CALL n10s.graphconfig.show()").data()
+    vocab_uris = config[0].get("handleVocabUris") if config else None
+    # Older n10s builds report the enum ordinal (4) instead of 'KEEP'
+    if vocab_uris not in ("KEEP", 4):
+        if config:
+            # n10s refuses to drop the config of a non-empty graph
+            tx.run("MATCH (n) DETACH DELETE n")
+            tx.run("CALL n10s.graphconfig.drop()")
+        tx.run(GRAPHCONFIG_INIT_CYPHER)
+
+    tx.run(
+        ADD_PREFIXES_CYPHER,
+        namespaces=[{"prefix": k, "uri": v} for k, v in NAMESPACES.items()],
+    )
 
     if "n10s.validation.shacl.clear" in procedures:
-        session.run("CALL n10s.validation.shacl.clear()")
+        tx.run("CALL n10s.validation.shacl.clear()")
     elif "n10s.validation.shacl.dropShapes" in procedures:
-        session.run("CALL n10s.validation.shacl.dropShapes()")
-
-    session.run(
+        tx.run("CALL n10s.validation.shacl.dropShapes()")
+    tx.run(
         "CALL n10s.validation.shacl.import.inline($rdf, 'Turtle')",
         rdf=shapes_text,
     )
 
+    tx.run(CLEAR_INSTANCE_CYPHER)
+    return tx.run(COUNT_SHAPES_CYPHER).single()["n"]
 
-@pytest.fixture(scope="function")
-def setup_neo4j(neo4j_session):
-    """Set up Neo4j with SHACL shapes for each test (lightweight, preserves shapes)."""
-    procedures = _has_n10s(neo4j_session)
-    if not procedures:
+
+@pytest.fixture(scope="module")
+def n10s_ready(neo4j_session, n10s_procedures, shacl_shapes_text):
+    """Configure n10s and load SHACL shapes once for the module."""
+    if not n10s_procedures:
         pytest.skip("n10s plugin not installed in Neo4j")
 
-    # Check current config
-    current_config = {}
-    try:
-        result = neo4j_session.run("CALL n10s.graphconfig.show()").data()
-        if result:
-            current_config = result[0]
-    except Exception:
-        pass
-
-    print(f"DEBUG: Current config: {current_config}")
-
-    # If config is missing or not KEEP, re-init
-    # We check for 'KEEP' or 4 (which seems to be the enum value for KEEP)
-    vocab_uris = current_config.get("handleVocabUris")
-    if vocab_uris != "KEEP" and vocab_uris != 4:
-        if current_config:
-            try:
-                # Ensure graph is empty before dropping config
-                neo4j_session.run("MATCH (n) DETACH DELETE n")
-                neo4j_session.run("CALL n10s.graphconfig.drop()")
-                print("DEBUG: Dropped existing config")
-            except Exception as e:
-                print(f"DEBUG: Drop config failed: {e}")
-
-        try:
-            neo4j_session.run(
-                "CALL n10s.graphconfig.init({"
-                "handleVocabUris:'KEEP',handleRDFTypes:'LABELS',"
-                "handleMultival:'ARRAY',keepLangTag:true})"
-            )
-            print("DEBUG: Initialized n10s with KEEP")
-        except Exception as e:
-            print(f"DEBUG: Init config failed: {e}")
-
-    # Ensure constraint exists (n10s requires it)
-    try:
-        neo4j_session.run(
-            "CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS "
-            "FOR (r:Resource) REQUIRE r.uri IS UNIQUE"
-        )
-    except Exception as e:
-        print(f"DEBUG: Create constraint failed: {e}")
-
-    # Register namespaces
-    namespaces = {
-        "logos": "http://logos.ontology/",
-        "sh": "http://www.w3.org/ns/shacl#",
-        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-        "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-        "xsd": "http://www.w3.org/2001/XMLSchema#",
-    }
-    for prefix, uri in namespaces.items():
-        try:
-            neo4j_session.run(f"CALL n10s.nsprefixes.add('{prefix}', '{uri}')")
-        except Neo4jError:
-            pass
-
-    _ensure_shapes(neo4j_session, procedures)
-    _clear_instance_data(neo4j_session)
-
-    shapes_count = len(
-        neo4j_session.run("CALL n10s.validation.shacl.listShapes()").data()
+    # Schema changes cannot share a transaction with data writes, so the
+    # uniqueness constraint n10s imports rely on is created up front.
+    neo4j_session.run(
+        "CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS "
+        "FOR (r:Resource) REQUIRE r.uri IS UNIQUE"
+    )
+
+    shapes_count = neo4j_session.execute_write(
+        _prepare_n10s, n10s_procedures, shacl_shapes_text
     )
     assert shapes_count > 0, "SHACL shapes should be loaded"
 
-    yield neo4j_session
+    return neo4j_session
 
-    _clear_instance_data(neo4j_session)
+
+@pytest.fixture(scope="function")
+def setup_neo4j(n10s_ready):
+    """Give each test an empty instance graph (lightweight, preserves shapes)."""
+    _clear_instance_data(n10s_ready)
+
+    yield n10s_ready
+
+    _clear_instance_data(n10s_ready)
 
 
 def test_neo4j_connection(neo4j_session):
     """Test that Neo4j connection is working."""
     result = neo4j_session.run("RETURN 1 AS test").single()
     assert result["test"] == 1
-    print("✓ Neo4j connection verified")
+    logger.debug("✓ Neo4j connection verified")
 
 
-def test_n10s_plugin_loaded(neo4j_session):
+def test_n10s_plugin_loaded(n10s_procedures):
     """Test that n10s plugin is loaded and procedures are available."""
-    procedures = [
-        p[0]
-        for p in neo4j_session.run(
-            "SHOW PROCEDURES YIELD name WHERE name STARTS WITH 'n10s' RETURN name"
-        ).values()
-    ]
+    procedures = n10s_procedures
 
     assert len(procedures) > 0, "n10s procedures should be available"
 
@@ -200,183 +177,165 @@ def test_n10s_plugin_loaded(neo4j_session):
         "n10s.graphconfig.init",
         "n10s.validation.shacl.import.inline",
         "n10s.validation.shacl.validate",
+        "n10s.validation.shacl.validateSet",
     ]
 
     for proc in required_procedures:
-        matching = [p for p in procedures if proc in p]
-        assert len(matching) > 0, f"Procedure {proc} should be available"
+        assert proc in procedures, f"Procedure {proc} should be available"
 
-    print(f"✓ n10s plugin loaded with {len(procedures)} procedures")
+    logger.debug("✓ n10s plugin loaded with %d procedures", len(procedures))
 
 
 def test_shacl_shapes_loaded(setup_neo4j):
     """Test that SHACL shapes are successfully loaded into Neo4j."""
-    shapes = setup_neo4j.run("CALL n10s.validation.shacl.listShapes()").data()
+    shapes_count = setup_neo4j.execute_read(
+        lambda tx: tx.run(COUNT_SHAPES_CYPHER).single()["n"]
+    )
 
-    assert len(shapes) > 0, "At least one SHACL shape should be loaded"
+    assert shapes_count > 0, "At least one SHACL shape should be loaded"
 
-    print(f"✓ Loaded {len(shapes)} SHACL shapes")
+    logger.debug("✓ Loaded %d SHACL shapes", shapes_count)
 
 
-def test_validate_valid_entities(setup_neo4j):
-    """Test that valid_entities.ttl passes SHACL validation."""
-    valid_file = Path(__file__).parent / "fixtures" / "valid_entities.ttl"
-    valid_text = valid_file.read_text(encoding="utf-8")
+@functools.cache
+def _subject_uris(rdf: str) -> tuple[str, ...]:
+    """Return the IRIs of the subjects described by a Turtle snippet."""
+    graph = Graph().parse(data=rdf, format="turtle")
+    return tuple(sorted({str(s) for s in graph.subjects() if isinstance(s, URIRef)}))
+
+
+def _local_name(iri) -> str:
+    """Return the fragment of a ``...#name`` IRI (or the value unchanged)."""
+    return str(iri).rpartition("#")[2]
+
+
+def _import_and_validate(tx, rdf, limit=None):
+    """Import Turtle and return the SHACL violations in a single transaction.
 
-    # Import valid data (keep original namespace)
-    setup_neo4j.run("CALL n10s.rdf.import.inline($rdf, 'Turtle')", rdf=valid_text)
+    Validation is scoped to the imported subjects with ``validateSet`` rather
+    than re-checking every node in the database with ``validate()``. The
+    imported subjects and their blank nodes are tagged for cleanup. When
+    ``limit`` is given, at most that many violations are returned.
+    """
+    uris = list(_subject_uris(rdf))
+    tx.run(IMPORT_RDF_CYPHER, rdf=rdf)
+    tx.run(TAG_IMPORTED_CYPHER, uris=uris)
+    if limit is None:
+        return tx.run(VALIDATE_SET_CYPHER, uris=uris).data()
+    return tx.run(VALIDATE_SET_CYPHER + "LIMIT $limit", uris=uris, limit=limit).data()
 
-    # Validate the data
-    validation_result = setup_neo4j.run("CALL n10s.validation.shacl.validate()")
 
-    # Check that validation passed (conforms = true or no violations)
-    # Consume the result to check for violations
-    violations = []
-    for record in validation_result:
-        violations.append(record)
+def test_validate_valid_entities(setup_neo4j, valid_entities_text):
+    """Test that valid_entities.ttl passes SHACL validation."""
+    # Import valid data (keep original namespace) and validate it
+    violations = setup_neo4j.execute_write(
+        _import_and_validate, valid_entities_text, SAMPLE_VIOLATIONS
+    )
 
     # If there are any violations, the test should fail
     if violations:
         pytest.fail(
             f"Valid data should not have violations. "
-            f"Found {len(violations)} violations: {violations}"
+            f"First violations found: {violations}"
         )
 
-    print("✓ Valid entities passed SHACL validation in Neo4j")
+    logger.debug("✓ Valid entities passed SHACL validation in Neo4j")
 
 
-def test_validate_invalid_entities(setup_neo4j):
+def test_validate_invalid_entities(setup_neo4j, invalid_entities_text):
     """Test that invalid_entities.ttl fails SHACL validation with violations."""
-    invalid_file = Path(__file__).parent / "fixtures" / "invalid_entities.ttl"
-    invalid_text = invalid_file.read_text(encoding="utf-8")
-
-    # Import invalid data (keep original namespace)
-    import_result = setup_neo4j.run(
-        "CALL n10s.rdf.import.inline($rdf, 'Turtle')", rdf=invalid_text
-    ).data()
-    print(f"\nDEBUG: Import result: {import_result}")
-
-    # DEBUG: Check what nodes were created
-    nodes = setup_neo4j.run(
-        "MATCH (n) RETURN labels(n) as labels, properties(n) as props"
-    ).data()
-    print(f"\nDEBUG: Nodes in graph: {nodes}")
-
-    # Validate the data
-    validation_result = setup_neo4j.run("CALL n10s.validation.shacl.validate()")
-
-    # Check that validation failed (violations should be present)
-    violations = []
-    for record in validation_result:
-        violations.append(record)
-
-    print(f"DEBUG: Found {len(violations)} violations")
-    for v in violations:
-        print(f"DEBUG: Violation: {v}")
+    # Import invalid data (keep original namespace) and validate it
+    violations = setup_neo4j.execute_write(
+        _import_and_validate, invalid_entities_text, SAMPLE_VIOLATIONS
+    )
 
     assert len(violations) > 0, "Invalid data should produce validation violations"
 
-    print(
-        f"✓ Invalid entities correctly produced {len(violations)} validation violations"
+    logger.debug(
+        "✓ Invalid entities correctly produced validation violations, e.g. %s",
+        violations[:3],
     )
-    print("  Sample violations:")
-    for i, violation in enumerate(violations[:3]):  # Show first 3 violations
-        print(f"    - Violation {i + 1}: {violation}")
 
 
-def test_reject_bad_write_wrong_uuid_prefix(setup_neo4j):
-    """Test that Neo4j rejects write with wrong UUID prefix through validation."""
-    # Create a node with wrong UUID format - missing required properties
-    # (flexible ontology uses logos:Node with required uuid, name, is_type_definition, type, ancestors)
-    bad_node_ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
-        @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
-
+# Bad writes: focus node -> (property whose absence is the error, Turtle).
+# All snippets share one prefix header and go to n10s as a single document, so
+# the whole batch is one import call; each case then checks that its own focus
+# node was reported.
+BAD_WRITES_PREFIXES = """
+@prefix logos: <http://logos.ai/ontology#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+"""
+BAD_WRITES = {
+    # Wrong UUID format and missing the required 'ancestors' property
+    # (flexible ontology uses logos:Node with required uuid, name,
+    # is_type_definition, type, ancestors)
+    "node-bad-prefix": (
+        "ancestors",
+        """
         logos:node-bad-prefix a logos:Node ;
             logos:uuid "wrong-prefix-123" ;
             logos:name "BadNode" ;
             logos:is_type_definition false ;
             logos:type "entity" .
-    """
-    # Note: This is missing required 'ancestors' property
-
-    # Import the bad data
-    setup_neo4j.run("CALL n10s.rdf.import.inline($rdf, 'Turtle')", rdf=bad_node_ttl)
-
-    # Validate - should fail due to missing ancestors
-    validation_result = setup_neo4j.run("CALL n10s.validation.shacl.validate()")
-
-    # Should have violations for missing required property
-    violations = []
-    for record in validation_result:
-        violations.append(record)
-
-    assert (
-        len(violations) > 0
-    ), "Missing required property should produce validation violations"
-
-    print("✓ Missing required property correctly rejected by SHACL validation")
-
-
-def test_reject_bad_write_missing_required_property(setup_neo4j):
-    """Test that Neo4j rejects write with missing required property through validation."""
-    # Create a Node without required 'name' field (flexible ontology)
-    bad_node_ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
-
+        """,
+    ),
+    # Node without required 'name' field
+    "node-no-name": (
+        "name",
+        """
         logos:node-no-name a logos:Node ;
             logos:uuid "node-missing-name" ;
             logos:is_type_definition false ;
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") .
-    """
-
-    # Import the bad data
-    setup_neo4j.run("CALL n10s.rdf.import.inline($rdf, 'Turtle')", rdf=bad_node_ttl)
-
-    # Validate - should fail
-    validation_result = setup_neo4j.run("CALL n10s.validation.shacl.validate()")
-
-    # Should have violations for missing required property
-    violations = []
-    for record in validation_result:
-        violations.append(record)
-
-    assert (
-        len(violations) > 0
-    ), "Missing required property should produce validation violations"
-
-    print("✓ Missing required property correctly rejected by SHACL validation")
-    print(f"  {len(violations)} violations detected")
-
-
-def test_reject_bad_write_entity_missing_uuid(setup_neo4j):
-    """Test that Neo4j rejects node write with missing UUID."""
-    # Create a Node without UUID (flexible ontology)
-    bad_node_ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
-
+        """,
+    ),
+    # Node without UUID
+    "node-no-uuid": (
+        "uuid",
+        """
         logos:node-no-uuid a logos:Node ;
             logos:name "NodeWithoutUUID" ;
             logos:is_type_definition false ;
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") .
+        """,
+    ),
+}
+BAD_WRITES_TTL = BAD_WRITES_PREFIXES + "".join(ttl for _, ttl in BAD_WRITES.values())
+
+
+@pytest.fixture(scope="module")
+def bad_write_violations(n10s_ready):
+    """Import every bad-write snippet at once and validate the graph once.
+
+    Violations are grouped by focus node here, in one pass, so each case
+    looks up its own results instead of rescanning the whole report.
     """
+    _clear_instance_data(n10s_ready)
+    try:
+        violations = n10s_ready.execute_write(_import_and_validate, BAD_WRITES_TTL)
+    finally:
+        _clear_instance_data(n10s_ready)
 
-    # Import the bad data
-    setup_neo4j.run("CALL n10s.rdf.import.inline($rdf, 'Turtle')", rdf=bad_node_ttl)
+    by_focus = defaultdict(list)
+    for v in violations:
+        by_focus[_local_name(v["focusNode"])].append(v)
+    return by_focus
 
-    # Validate - should fail
-    validation_result = setup_neo4j.run("CALL n10s.validation.shacl.validate()")
 
-    # Should have violations for missing UUID
-    violations = []
-    for record in validation_result:
-        violations.append(record)
+@pytest.mark.parametrize("focus_node", BAD_WRITES)
+def test_reject_bad_write(bad_write_violations, focus_node):
+    """Test that Neo4j rejects each bad write through SHACL validation."""
+    missing_property, _ = BAD_WRITES[focus_node]
+    violations = bad_write_violations.get(focus_node, [])
 
-    assert len(violations) > 0, "Missing UUID should produce validation violations"
+    assert len(violations) > 0, f"{focus_node} should produce validation violations"
+    assert missing_property in {
+        _local_name(v["resultPath"]) for v in violations
+    }, f"{focus_node} should be reported for missing {missing_property}"
 
-    print("✓ Missing UUID correctly rejected by SHACL validation")
+    logger.debug("✓ %s correctly rejected by SHACL validation", focus_node)
 
 
 if __name__ == "__main__":
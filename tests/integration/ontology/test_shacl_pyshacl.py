@@ -12,36 +12,22 @@ All nodes use logos:Node with required properties:
 Reference: docs/plans/2025-12-30-flexible-ontology-design.md
 """
 
-from pathlib import Path
+from collections.abc import Callable
 
 import pytest
-from pyshacl import validate
 from rdflib import Graph
 
-from logos_test_utils.env import get_repo_root
-
-
-def _load_graph(path: Path) -> Graph:
-    g = Graph()
-    g.parse(path, format="turtle")
-    return g
-
-
-@pytest.fixture(scope="module")
-def shapes_graph() -> Graph:
-    repo_root = get_repo_root()
-    shapes_path = repo_root / "ontology" / "shacl_shapes.ttl"
-    return _load_graph(shapes_path)
-
 
 def _assert_validation(
-    data_graph: Graph, shapes_graph: Graph, expect_conforms: bool
+    data_graph: Graph,
+    shacl_validator: Callable[..., tuple],
+    expect_conforms: bool,
 ) -> None:
-    conforms, report, _ = validate(
-        data_graph=data_graph,
-        shacl_graph=shapes_graph,
-        inference="rdfs",
-        abort_on_first=False,
+    conforms, _, report = shacl_validator(
+        data_graph,
+        # A single violation settles an expected failure; keep the full
+        # report for conforming cases so regressions are easy to read.
+        abort_on_first=not expect_conforms,
     )
     if expect_conforms:
         assert conforms, f"Expected conforming data, but got violations:\n{report}"
@@ -49,81 +35,57 @@ def _assert_validation(
         assert not conforms, "Expected validation failures, but data conformed"
 
 
-def test_valid_entities_conform(shapes_graph: Graph) -> None:
-    data = _load_graph(Path(__file__).parent / "fixtures" / "valid_entities.ttl")
-    _assert_validation(data, shapes_graph, expect_conforms=True)
-
-
-def test_invalid_entities_fail(shapes_graph: Graph) -> None:
-    data = _load_graph(Path(__file__).parent / "fixtures" / "invalid_entities.ttl")
-    _assert_validation(data, shapes_graph, expect_conforms=False)
-
-
-def test_missing_uuid_fails(shapes_graph: Graph) -> None:
-    """Test that a node missing uuid fails validation."""
-    ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
-
-        logos:node-no-uuid a logos:Node ;
-            logos:name "NodeWithoutUUID" ;
-            logos:is_type_definition false ;
-            logos:type "entity" ;
-            logos:ancestors ("entity" "thing") .
-    """
-    g = Graph()
-    g.parse(data=ttl, format="turtle")
-    _assert_validation(g, shapes_graph, expect_conforms=False)
-
-
-def test_missing_name_fails(shapes_graph: Graph) -> None:
-    """Test that a node missing name fails validation."""
-    ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
-
-        logos:node-no-name a logos:Node ;
-            logos:uuid "node-no-name" ;
-            logos:is_type_definition false ;
-            logos:type "entity" ;
-            logos:ancestors ("entity" "thing") .
-    """
-    g = Graph()
-    g.parse(data=ttl, format="turtle")
-    _assert_validation(g, shapes_graph, expect_conforms=False)
-
-
-def test_missing_type_fails(shapes_graph: Graph) -> None:
-    """Test that a node missing type fails validation."""
-    ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
+def test_valid_entities_conform(
+    shacl_validator: Callable[..., tuple], valid_data: Graph
+) -> None:
+    _assert_validation(valid_data, shacl_validator, expect_conforms=True)
 
-        logos:node-no-type a logos:Node ;
-            logos:uuid "node-no-type" ;
-            logos:name "NodeWithoutType" ;
-            logos:is_type_definition false ;
-            logos:ancestors ("entity" "thing") .
-    """
-    g = Graph()
-    g.parse(data=ttl, format="turtle")
-    _assert_validation(g, shapes_graph, expect_conforms=False)
 
+def test_invalid_entities_fail(
+    shacl_validator: Callable[..., tuple], invalid_data: Graph
+) -> None:
+    _assert_validation(invalid_data, shacl_validator, expect_conforms=False)
+
+
+# Every property the NodeShape requires; each case drops exactly one of them
+# from an otherwise valid instance node.
+REQUIRED_NODE_PROPERTIES = {
+    "uuid": '"node-missing-property"',
+    "name": '"NodeMissingProperty"',
+    "is_type_definition": "false",
+    "type": '"entity"',
+    "ancestors": '("entity" "thing")',
+}
+
+
+def _node_without(missing: str) -> str:
+    """Return Turtle for an instance node lacking the ``missing`` property."""
+    properties = " ;\n    ".join(
+        f"logos:{name} {value}"
+        for name, value in REQUIRED_NODE_PROPERTIES.items()
+        if name != missing
+    )
+    return (
+        "@prefix logos: <http://logos.ai/ontology#> .\n\n"
+        f"logos:node-no-{missing} a logos:Node ;\n    {properties} .\n"
+    )
 
-def test_missing_is_type_definition_fails(shapes_graph: Graph) -> None:
-    """Test that a node missing is_type_definition fails validation."""
-    ttl = """
-        @prefix logos: <http://logos.ai/ontology#> .
 
-        logos:node-no-is-type-def a logos:Node ;
-            logos:uuid "node-no-is-type-def" ;
-            logos:name "NodeWithoutIsTypeDef" ;
-            logos:type "entity" ;
-            logos:ancestors ("entity" "thing") .
-    """
-    g = Graph()
-    g.parse(data=ttl, format="turtle")
-    _assert_validation(g, shapes_graph, expect_conforms=False)
+@pytest.mark.parametrize("missing", REQUIRED_NODE_PROPERTIES)
+def test_missing_required_property_fails(
+    shacl_validator: Callable[..., tuple],
+    turtle_graph: Callable[[str], Graph],
+    missing: str,
+) -> None:
+    """Test that a node missing any required property fails validation."""
+    _assert_validation(
+        turtle_graph(_node_without(missing)), shacl_validator, expect_conforms=False
+    )
 
 
-def test_node_round_trip(shapes_graph: Graph) -> None:
+def test_node_round_trip(
+    shacl_validator: Callable[..., tuple], turtle_graph: Callable[[str], Graph]
+) -> None:
     """
     Test node round-trip: create valid nodes with relationships, validate them.
 
@@ -177,14 +139,13 @@ def test_node_round_trip(shapes_graph: Graph) -> None:
         logos:instance-robot-arm-01 logos:IS_A logos:type-robot .
         logos:instance-robot-state-initial logos:IS_A logos:type-robot_state .
     """
-    g = Graph()
-    g.parse(data=ttl, format="turtle")
-
     # Validate - should pass
-    _assert_validation(g, shapes_graph, expect_conforms=True)
+    _assert_validation(turtle_graph(ttl), shacl_validator, expect_conforms=True)
 
 
-def test_valid_bootstrap_types(shapes_graph: Graph) -> None:
+def test_valid_bootstrap_types(
+    shacl_validator: Callable[..., tuple], turtle_graph: Callable[[str], Graph]
+) -> None:
     """Test that bootstrap types with empty ancestors pass validation."""
     ttl = """
         @prefix logos: <http://logos.ai/ontology#> .
@@ -205,6 +166,4 @@ def test_valid_bootstrap_types(shapes_graph: Graph) -> None:
             logos:type "thing" ;
             logos:ancestors () .
     """
-    g = Graph()
-    g.parse(data=ttl, format="turtle")
-    _assert_validation(g, shapes_graph, expect_conforms=True)
+    _assert_validation(turtle_graph(ttl), shacl_validator, expect_conforms=True)
@@ -17,193 +17,111 @@ Reference: docs/PHASE1_VERIFY.md, M2 section
 Reference: docs/plans/2025-12-30-flexible-ontology-design.md
 """
 
-from pathlib import Path
+import logging
 
 import pytest
-from pyshacl import validate
-from rdflib import Graph
+from rdflib import Namespace
+from rdflib.namespace import SH
 
-from logos_test_utils.env import get_repo_root
+LOGOS = Namespace("http://logos.ai/ontology#")
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture
-def shacl_shapes():
-    """Load SHACL shapes from ontology directory."""
-    repo_root = get_repo_root()
-    shapes_file = repo_root / "ontology" / "shacl_shapes.ttl"
-    shapes_graph = Graph()
-    shapes_graph.parse(shapes_file, format="turtle")
-    return shapes_graph
+# shacl_shapes, shacl_validator, valid_data and invalid_data are session
+# fixtures shared with test_shacl_pyshacl.py (see conftest.py).
 
 
-@pytest.fixture
-def valid_data():
-    """Load valid test data."""
-    valid_file = Path(__file__).parent / "fixtures" / "valid_entities.ttl"
-    data_graph = Graph()
-    data_graph.parse(valid_file, format="turtle")
-    return data_graph
-
-
-@pytest.fixture
-def invalid_data():
-    """Load invalid test data."""
-    invalid_file = Path(__file__).parent / "fixtures" / "invalid_entities.ttl"
-    data_graph = Graph()
-    data_graph.parse(invalid_file, format="turtle")
-    return data_graph
-
-
-def test_shacl_shapes_load(shacl_shapes):
-    """Test that SHACL shapes file is syntactically valid and loads."""
-    assert len(shacl_shapes) > 0, "SHACL shapes graph should not be empty"
-    print(f"✓ Loaded {len(shacl_shapes)} SHACL triples")
-
-
-def test_valid_entities_pass_validation(shacl_shapes, valid_data):
+def test_valid_entities_pass_validation(shacl_validator, valid_data):
     """Test that valid entity data passes SHACL validation."""
-    conforms, results_graph, results_text = validate(
-        valid_data, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
+    conforms, results_graph, results_text = shacl_validator(valid_data)
 
     assert conforms, f"Valid data should pass validation. Results:\n{results_text}"
-    print("✓ Valid entities passed SHACL validation")
+    logger.debug("✓ Valid entities passed SHACL validation")
 
 
-def test_invalid_entities_fail_validation(shacl_shapes, invalid_data):
+def test_invalid_entities_fail_validation(shacl_validator, invalid_data):
     """Test that invalid entity data fails SHACL validation."""
-    conforms, results_graph, results_text = validate(
-        invalid_data, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
+    conforms, results_graph, results_text = shacl_validator(
+        invalid_data, abort_on_first=True
     )
 
     assert not conforms, "Invalid data should fail validation"
-    print("✓ Invalid entities correctly failed SHACL validation")
-    print(f"  Validation report: {results_text}")
+    logger.debug(
+        "✓ Invalid entities correctly failed SHACL validation: %s", results_text
+    )
 
 
-def test_missing_uuid_detected(shacl_shapes):
-    """Test that missing UUID is detected by SHACL validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+# Inline cases: (Turtle, should_conform, sh:resultPath expected in the report).
+# Each case is an independent, CPU-bound pyshacl run, so they spread across
+# workers under ``pytest -n auto``; every worker parses the shapes once.
+VALIDATION_CASES = [
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:node-no-uuid a logos:Node ;
             logos:name "MissingUUID" ;
             logos:is_type_definition false ;
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert not conforms, "Node without UUID should fail validation"
-    assert (
-        "uuid" in results_text.lower() or "minCount" in results_text
-    ), "Validation error should mention missing UUID"
-    print("✓ Missing UUID correctly detected")
-
-
-def test_missing_name_detected(shacl_shapes):
-    """Test that missing name is detected by SHACL validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        False,
+        LOGOS.uuid,
+        id="missing-uuid",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:node-no-name a logos:Node ;
             logos:uuid "node-no-name" ;
             logos:is_type_definition false ;
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert not conforms, "Node without name should fail validation"
-    print("✓ Missing name correctly detected")
-
-
-def test_missing_type_detected(shacl_shapes):
-    """Test that missing type is detected by SHACL validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        False,
+        None,
+        id="missing-name",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:node-no-type a logos:Node ;
             logos:uuid "node-no-type" ;
             logos:name "MissingType" ;
             logos:is_type_definition false ;
             logos:ancestors ("entity" "thing") .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert not conforms, "Node without type should fail validation"
-    print("✓ Missing type correctly detected")
-
-
-def test_missing_is_type_definition_detected(shacl_shapes):
-    """Test that missing is_type_definition is detected by SHACL validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        False,
+        None,
+        id="missing-type",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:node-no-is-type-def a logos:Node ;
             logos:uuid "node-no-is-type-def" ;
             logos:name "MissingIsTypeDef" ;
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert not conforms, "Node without is_type_definition should fail validation"
-    print("✓ Missing is_type_definition correctly detected")
-
-
-def test_missing_ancestors_detected(shacl_shapes):
-    """Test that missing ancestors is detected by SHACL validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        False,
+        None,
+        id="missing-is-type-definition",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:node-no-ancestors a logos:Node ;
             logos:uuid "node-no-ancestors" ;
             logos:name "MissingAncestors" ;
             logos:is_type_definition false ;
             logos:type "entity" .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert not conforms, "Node without ancestors should fail validation"
-    print("✓ Missing ancestors correctly detected")
-
-
-def test_valid_complete_node(shacl_shapes):
-    """Test that a complete valid node passes validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        False,
+        None,
+        id="missing-ancestors",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:valid-node a logos:Node ;
             logos:uuid "valid-node-001" ;
@@ -211,23 +129,13 @@ def test_valid_complete_node(shacl_shapes):
             logos:is_type_definition false ;
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert conforms, f"Complete valid node should pass. Results:\n{results_text}"
-    print("✓ Valid complete node passed validation")
-
-
-def test_valid_type_definition(shacl_shapes):
-    """Test that a valid type definition passes validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        True,
+        None,
+        id="valid-complete-node",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:type-robot a logos:Node ;
             logos:uuid "5e6f7a8b-9c0d-5e1f-2a3b-4c5d6e7f8a9b" ;
@@ -235,23 +143,13 @@ def test_valid_type_definition(shacl_shapes):
             logos:is_type_definition true ;
             logos:type "robot" ;
             logos:ancestors ("entity" "thing") .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert conforms, f"Valid type definition should pass. Results:\n{results_text}"
-    print("✓ Valid type definition passed validation")
-
-
-def test_valid_bootstrap_type(shacl_shapes):
-    """Test that bootstrap types with empty ancestors pass validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        True,
+        None,
+        id="valid-type-definition",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
         logos:type-concept a logos:Node ;
             logos:uuid "f8b89a6c-9c3e-5e4d-b2f1-83a4d7e4c5f2" ;
@@ -259,23 +157,13 @@ def test_valid_bootstrap_type(shacl_shapes):
             logos:is_type_definition true ;
             logos:type "concept" ;
             logos:ancestors () .
-    """,
-        format="turtle",
-    )
-
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
-    )
-
-    assert conforms, f"Bootstrap type should pass. Results:\n{results_text}"
-    print("✓ Valid bootstrap type passed validation")
-
-
-def test_is_a_relationship_to_node(shacl_shapes):
-    """Test that IS_A relationship to a valid Node passes validation."""
-    data_graph = Graph()
-    data_graph.parse(
-        data="""
+        """,
+        True,
+        None,
+        id="valid-bootstrap-type",
+    ),
+    pytest.param(
+        """
         @prefix logos: <http://logos.ai/ontology#> .
 
         logos:type-entity a logos:Node ;
@@ -292,16 +180,36 @@ def test_is_a_relationship_to_node(shacl_shapes):
             logos:type "entity" ;
             logos:ancestors ("entity" "thing") ;
             logos:IS_A logos:type-entity .
-    """,
-        format="turtle",
-    )
+        """,
+        True,
+        None,
+        id="is-a-relationship-to-node",
+    ),
+]
 
-    conforms, results_graph, results_text = validate(
-        data_graph, shacl_graph=shacl_shapes, inference="rdfs", abort_on_first=False
+
+@pytest.mark.parametrize("data_text, should_conform, expected_path", VALIDATION_CASES)
+def test_inline_validation(
+    shacl_validator, turtle_graph, data_text, should_conform, expected_path
+):
+    """Test that each inline snippet conforms (or not) as expected."""
+    data_graph = turtle_graph(data_text)
+
+    # Each negative snippet has exactly one defect, so the first violation is
+    # also the one any expected_path refers to.
+    conforms, results_graph, results_text = shacl_validator(
+        data_graph, abort_on_first=not should_conform
     )
 
-    assert conforms, f"Valid IS_A relationship should pass. Results:\n{results_text}"
-    print("✓ Valid IS_A relationship passed validation")
+    assert (
+        conforms == should_conform
+    ), f"Expected conforms={should_conform}. Results:\n{results_text}"
+    if expected_path is not None:
+        # Match on the report graph rather than the formatted text.
+        result_paths = set(results_graph.objects(predicate=SH.resultPath))
+        assert (
+            expected_path in result_paths
+        ), f"Expected a result on {expected_path}. Results:\n{results_text}"
 
 
 if __name__ == "__main__":
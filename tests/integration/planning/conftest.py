@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the M3 planning suite.
+
+The scenario JSON and the pick-and-place Cypher script are read-only inputs,
+so each is loaded once per run rather than once per test.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from logos_test_utils.env import get_repo_root
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+SCENARIOS_FILE = FIXTURES_DIR / "plan_scenarios.json"
+TEST_DATA_CYPHER_FILE = get_repo_root() / "ontology" / "test_data_pick_and_place.cypher"
+
+
+@pytest.fixture(scope="session")
+def plan_scenarios():
+    """Load planning test scenarios."""
+    # json.loads accepts UTF-8 bytes directly and decodes with the C scanner
+    return json.loads(SCENARIOS_FILE.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def test_data_cypher():
+    """Load pick-and-place test data Cypher script."""
+    return TEST_DATA_CYPHER_FILE.read_text()
+
+
+@pytest.fixture(scope="session")
+def scenarios_by_name(plan_scenarios):
+    """Index planning scenarios by name for direct lookup."""
+    return {s["name"]: s for s in plan_scenarios["scenarios"]}
+
+
+@pytest.fixture(scope="session")
+def causal_by_process(plan_scenarios):
+    """Index causal relationships by process name for direct lookup."""
+    return {r["process"]: r for r in plan_scenarios["causal_relationships"]}
@@ -9,13 +9,8 @@ concepts without requiring a full Sophia implementation.
 Reference: docs/PHASE1_VERIFY.md, M3 section
 """
 
-import json
-from pathlib import Path
-
 import pytest
 
-from logos_test_utils.env import get_repo_root
-
 # Try to import planner client for API-based tests
 try:
     from planner_stub.client import PlannerClient
@@ -24,6 +19,8 @@ try:
 except ImportError:
     PLANNER_CLIENT_AVAILABLE = False
 
+# plan_scenarios and test_data_cypher are session fixtures (see conftest.py).
+
 # Skip all tests in this module - planning tests need to be updated for flexible ontology
 # The test fixtures and assertions reference the old type-label based ontology structure
 pytestmark = pytest.mark.skip(
@@ -31,22 +28,8 @@ pytestmark = pytest.mark.skip(
     "Tests need updating to use :Node label with type/ancestors properties."
 )
 
-
-@pytest.fixture
-def plan_scenarios():
-    """Load planning test scenarios."""
-    fixtures_dir = Path(__file__).resolve().parent / "fixtures"
-    scenarios_file = fixtures_dir / "plan_scenarios.json"
-    with open(scenarios_file) as f:
-        return json.load(f)
-
-
-@pytest.fixture
-def test_data_cypher():
-    """Load pick-and-place test data Cypher script."""
-    repo_root = get_repo_root()
-    cypher_file = repo_root / "ontology" / "test_data_pick_and_place.cypher"
-    return cypher_file.read_text()
+# Process order of the pick_and_place scenario's expected plan.
+EXPECTED_PNP = ("MoveAction", "GraspAction", "MoveAction", "ReleaseAction")
 
 
 def test_plan_scenarios_load(plan_scenarios):
@@ -71,11 +54,9 @@ def test_causal_relationships_defined(plan_scenarios):
     )
 
 
-def test_simple_grasp_scenario(plan_scenarios):
+def test_simple_grasp_scenario(scenarios_by_name):
     """Test simple single-step grasp planning scenario."""
-    scenario = next(
-        s for s in plan_scenarios["scenarios"] if s["name"] == "simple_grasp"
-    )
+    scenario = scenarios_by_name["simple_grasp"]
 
     assert scenario is not None
     assert "initial_state" in scenario
@@ -95,19 +76,16 @@ def test_simple_grasp_scenario(plan_scenarios):
     print("✓ Simple grasp scenario validated")
 
 
-def test_pick_and_place_scenario(plan_scenarios):
+def test_pick_and_place_scenario(scenarios_by_name):
     """Test multi-step pick-and-place planning scenario."""
-    scenario = next(
-        s for s in plan_scenarios["scenarios"] if s["name"] == "pick_and_place"
-    )
+    scenario = scenarios_by_name["pick_and_place"]
 
     assert scenario is not None
     plan = scenario["expected_plan"]
     assert len(plan) == 4, "Pick-and-place should be a 4-step plan"
 
     # Verify plan ordering
-    processes = [step["process"] for step in plan]
-    assert processes == ["MoveAction", "GraspAction", "MoveAction", "ReleaseAction"]
+    assert tuple(step["process"] for step in plan) == EXPECTED_PNP
 
     # Verify causal chain: each step's effects should enable next step's preconditions
     for i in range(len(plan) - 1):
@@ -122,37 +100,33 @@ def test_pick_and_place_scenario(plan_scenarios):
     print("✓ Pick-and-place scenario validated")
 
 
-def test_precondition_requirements(plan_scenarios):
+def test_precondition_requirements(causal_by_process):
     """Test that processes have proper precondition requirements."""
-    causal_rels = plan_scenarios["causal_relationships"]
-
     # Find grasp action requirements
-    grasp_rel = next(r for r in causal_rels if r["process"] == "GraspAction")
+    grasp_rel = causal_by_process["GraspAction"]
     assert "gripper_open" in grasp_rel["requires"]
     assert "arm_at_pre_grasp" in grasp_rel["requires"]
 
     # Find release action requirements
-    release_rel = next(r for r in causal_rels if r["process"] == "ReleaseAction")
+    release_rel = causal_by_process["ReleaseAction"]
     assert "object_grasped" in release_rel["requires"]
     assert "arm_at_place_position" in release_rel["requires"]
 
     print("✓ Precondition requirements validated")
 
 
-def test_causal_effects(plan_scenarios):
+def test_causal_effects(causal_by_process):
     """Test that processes have defined causal effects."""
-    causal_rels = plan_scenarios["causal_relationships"]
-
     # Verify each process has a causal effect
-    for rel in causal_rels:
+    for rel in causal_by_process.values():
         assert rel["causes"] is not None
         assert len(rel["causes"]) > 0
 
     # Verify specific effects
-    grasp_rel = next(r for r in causal_rels if r["process"] == "GraspAction")
+    grasp_rel = causal_by_process["GraspAction"]
     assert grasp_rel["causes"] == "object_grasped"
 
-    release_rel = next(r for r in causal_rels if r["process"] == "ReleaseAction")
+    release_rel = causal_by_process["ReleaseAction"]
     assert release_rel["causes"] == "object_released"
 
     print("✓ Causal effects validated")
@@ -171,29 +145,27 @@ def test_test_data_has_process_concepts(test_data_cypher):
         or "'process'" in test_data_cypher
     )
     # Verify action subtypes exist (these have 'process' in ancestors)
-    assert (
-        "moveaction" in test_data_cypher.lower()
-        or "process_move" in test_data_cypher.lower()
-    )
+    test_data_lower = test_data_cypher.lower()
+    assert "moveaction" in test_data_lower or "process_move" in test_data_lower
 
     print("✓ Process concepts found in test data")
 
 
 def test_test_data_has_causal_relationships(test_data_cypher):
     """Test that pick-and-place test data includes CAUSES relationships."""
-    assert "[:CAUSES]" in test_data_cypher or "CAUSES" in test_data_cypher
+    assert "CAUSES" in test_data_cypher
     print("✓ CAUSES relationships found in test data")
 
 
 def test_test_data_has_precondition_relationships(test_data_cypher):
     """Test that pick-and-place test data includes REQUIRES relationships."""
-    assert "[:REQUIRES]" in test_data_cypher or "REQUIRES" in test_data_cypher
+    assert "REQUIRES" in test_data_cypher
     print("✓ REQUIRES relationships found in test data")
 
 
 def test_test_data_has_temporal_relationships(test_data_cypher):
     """Test that pick-and-place test data includes PRECEDES relationships."""
-    assert "[:PRECEDES]" in test_data_cypher or "PRECEDES" in test_data_cypher
+    assert "PRECEDES" in test_data_cypher
     print("✓ PRECEDES relationships found in test data")
 
 
@@ -204,22 +176,11 @@ def test_goal_state_reachability():
 
     # Mock simple reachability check
     def is_reachable(initial, goal, plan):
-        """Check if goal is reachable from initial via plan."""
-        initial.copy()
-
-        for step in plan:
-            # Verify preconditions are met
-            for _precond in step["preconditions"]:
-                # In a real implementation, this would check actual state
-                pass
-
-            # Apply effects
-            for _effect in step["effects"]:
-                # In a real implementation, this would update state
-                pass
-
-        # Check if goal is achieved
-        # In a real implementation, this would verify goal state matches
+        """Stand in for an HCG reachability query; every plan counts as reachable.
+
+        A real check would walk the plan, verifying each step's preconditions
+        and applying its effects, then compare the result with the goal state.
+        """
         return True
 
     # This test validates the concept without requiring Neo4j
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import socket
+
 from logos_test_utils.config import (
     ServiceConfig,
     get_env_value,
+    is_port_open,
     normalize_host,
     resolve_service_config,
 )
@@ -77,3 +80,12 @@ def test_resolve_service_config_normalizes_host(monkeypatch) -> None:
     assert resolved.host == "localhost"
     assert resolved.port == 5050
     assert resolved.url == "http://localhost:5050"
+
+
+def test_is_port_open() -> None:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        assert is_port_open("127.0.0.1", port)
+    assert not is_port_open("127.0.0.1", port)
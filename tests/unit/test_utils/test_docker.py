@@ -0,0 +1,42 @@
+"""Tests for logos_test_utils Docker helpers."""
+
+from __future__ import annotations
+
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from logos_test_utils import docker as docker_utils
+
+
+@pytest.fixture
+def fake_docker_ps(monkeypatch):
+    run = MagicMock(
+        return_value=subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="logos-hcg-neo4j\n", stderr=""
+        )
+    )
+    monkeypatch.setattr(docker_utils.subprocess, "run", run)
+    monkeypatch.delenv("LOGOS_SKIP_DOCKER_CHECK", raising=False)
+    return run
+
+
+def test_is_container_running_checks_live(fake_docker_ps) -> None:
+    assert docker_utils.is_container_running("logos-hcg-neo4j")
+    fake_docker_ps.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr=""
+    )
+    assert not docker_utils.is_container_running("logos-hcg-neo4j")
+    assert fake_docker_ps.call_count == 2
+
+
+def test_is_container_running_skip_env(fake_docker_ps, monkeypatch) -> None:
+    monkeypatch.setenv("LOGOS_SKIP_DOCKER_CHECK", "1")
+    assert docker_utils.is_container_running("anything")
+    fake_docker_ps.assert_not_called()
+
+
+def test_is_container_running_empty_name(fake_docker_ps) -> None:
+    assert not docker_utils.is_container_running("")
+    fake_docker_ps.assert_not_called()
@@ -0,0 +1,143 @@
+"""Tests for logos_test_utils Neo4j helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from logos_test_utils import neo4j as neo4j_utils
+from logos_test_utils.neo4j import Neo4jConfig
+
+
+@pytest.fixture
+def fake_driver_factory(monkeypatch):
+    factory = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+    monkeypatch.setattr(neo4j_utils.GraphDatabase, "driver", factory)
+    monkeypatch.setattr(neo4j_utils, "_SHARED_DRIVERS", {})
+    monkeypatch.setattr(neo4j_utils, "_AVAILABLE_CONFIGS", set())
+    monkeypatch.setattr(neo4j_utils, "_bolt_port_open", lambda uri: True)
+    return factory
+
+
+def _config(password: str = "secret") -> Neo4jConfig:
+    return Neo4jConfig(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password=password,
+        container="logos-hcg-neo4j",
+    )
+
+
+def test_shared_driver_is_reused(fake_driver_factory) -> None:
+    first = neo4j_utils.get_shared_neo4j_driver(_config())
+    second = neo4j_utils.get_shared_neo4j_driver(_config())
+    assert first is second
+    assert fake_driver_factory.call_count == 1
+
+
+def test_shared_driver_uses_small_pool(fake_driver_factory) -> None:
+    neo4j_utils.get_shared_neo4j_driver(_config())
+    _, kwargs = fake_driver_factory.call_args
+    assert kwargs["max_connection_pool_size"] == 4
+
+
+def test_shared_driver_keyed_on_credentials(fake_driver_factory) -> None:
+    first = neo4j_utils.get_shared_neo4j_driver(_config("one"))
+    second = neo4j_utils.get_shared_neo4j_driver(_config("two"))
+    assert first is not second
+
+
+def test_close_shared_drivers(fake_driver_factory) -> None:
+    driver = neo4j_utils.get_shared_neo4j_driver(_config())
+    neo4j_utils.close_shared_neo4j_drivers()
+    driver.close.assert_called_once_with()
+    assert neo4j_utils.get_shared_neo4j_driver(_config()) is not driver
+
+
+def test_is_neo4j_available_probes_once(fake_driver_factory) -> None:
+    assert neo4j_utils.is_neo4j_available(_config())
+    assert neo4j_utils.is_neo4j_available(_config())
+    driver = neo4j_utils.get_shared_neo4j_driver(_config())
+    assert driver.session.call_count == 1
+
+
+def test_is_neo4j_available_skips_driver_when_port_closed(
+    fake_driver_factory, monkeypatch
+) -> None:
+    monkeypatch.setattr(neo4j_utils, "_bolt_port_open", lambda uri: False)
+    assert not neo4j_utils.is_neo4j_available(_config())
+    fake_driver_factory.assert_not_called()
+
+
+def test_is_neo4j_available_does_not_remember_failures(
+    fake_driver_factory, monkeypatch
+) -> None:
+    monkeypatch.setattr(neo4j_utils, "_bolt_port_open", lambda uri: False)
+    assert not neo4j_utils.is_neo4j_available(_config())
+    monkeypatch.setattr(neo4j_utils, "_bolt_port_open", lambda uri: True)
+    assert neo4j_utils.is_neo4j_available(_config())
+
+
+def test_split_cypher_statements_skips_comments_and_blanks() -> None:
+    script = (
+        "// header; not a statement\n"
+        "CREATE CONSTRAINT c IF NOT EXISTS\n"
+        "FOR (n:Node) REQUIRE n.uuid IS UNIQUE;\n"
+        "\n"
+        "MERGE (n:Node {name: 'a;b'}) RETURN n;  \n"
+        "MATCH (n) RETURN n\n"
+    )
+    assert neo4j_utils.split_cypher_statements(script) == [
+        "CREATE CONSTRAINT c IF NOT EXISTS\nFOR (n:Node) REQUIRE n.uuid IS UNIQUE",
+        "MERGE (n:Node {name: 'a;b'}) RETURN n",
+        "MATCH (n) RETURN n",
+    ]
+
+
+def test_cypher_shell_uses_plain_format() -> None:
+    command = neo4j_utils._cypher_shell_command(_config())
+    assert command[command.index("--format") + 1] == "plain"
+
+
+SCRIPT = "MERGE (a:Node {uuid: 'a'});\nMERGE (b:Node {uuid: 'b'});\n"
+STATEMENTS = ["MERGE (a:Node {uuid: 'a'})", "MERGE (b:Node {uuid: 'b'})"]
+
+
+def _run_load(tmp_path, loaded=None, **kwargs):
+    script = tmp_path / "data.cypher"
+    script.write_text(SCRIPT)
+    tx = MagicMock()
+    tx.run.return_value.single.return_value = {"loaded": loaded}
+    driver = neo4j_utils.get_shared_neo4j_driver(_config())
+    session = driver.session.return_value.__enter__.return_value
+    session.execute_write.side_effect = lambda work: work(tx)
+    ran = neo4j_utils.execute_cypher_file(script, _config(), **kwargs)
+    session.run.assert_called_once_with(neo4j_utils._FINGERPRINT_CONSTRAINT_CYPHER)
+    return ran, [c.args[0] for c in tx.run.call_args_list]
+
+
+def test_execute_cypher_file_always_runs_by_default(
+    fake_driver_factory, tmp_path
+) -> None:
+    ran, queries = _run_load(tmp_path)
+    assert ran is True
+    assert queries[:2] == STATEMENTS
+    assert queries[2] == neo4j_utils._RECORD_FINGERPRINT_CYPHER
+
+
+def test_execute_cypher_file_skips_when_sentinel_loaded(
+    fake_driver_factory, tmp_path
+) -> None:
+    ran, queries = _run_load(tmp_path, loaded=True, sentinel_uuid="a")
+    assert ran is False
+    assert queries == [neo4j_utils._LOADED_FINGERPRINT_CYPHER]
+
+
+def test_execute_cypher_file_reloads_when_sentinel_missing(
+    fake_driver_factory, tmp_path
+) -> None:
+    # A deleted sentinel (or changed script) makes the check return null/false
+    ran, queries = _run_load(tmp_path, loaded=None, sentinel_uuid="a")
+    assert ran is True
+    assert queries[1:3] == STATEMENTS
@@ -0,0 +1,28 @@
+"""Tests for logos_test_utils xdist helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from logos_test_utils.xdist import get_worker_id, run_once_per_session
+
+
+def test_worker_defaults_without_xdist(monkeypatch) -> None:
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert get_worker_id() == "master"
+
+
+def test_run_once_per_session_across_workers(monkeypatch, tmp_path) -> None:
+    calls: list[str] = []
+    for worker in ("gw0", "gw1"):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+        worker_basetemp = tmp_path / f"popen-{worker}"
+        worker_basetemp.mkdir()
+        factory = MagicMock()
+        factory.getbasetemp.return_value = worker_basetemp
+        run_once_per_session(
+            factory,
+            "loaded",
+            lambda worker=worker: calls.append(worker),
+        )
+    assert calls == ["gw0"]